@@ -16,17 +16,21 @@ from ..segmentation import make_background_transparent
 
 def tensor_to_pil(tensor: torch.Tensor) -> Image.Image:
     """Convert ComfyUI IMAGE tensor to PIL Image."""
-    img = tensor.squeeze(0).cpu().numpy()
-    img = (img * 255).clip(0, 255).astype(np.uint8)
+    # Scale/clamp/narrow in torch before the cpu() hop: one fused ATen (or
+    # CUDA) pass, and only the uint8 result crosses to host memory.
+    img = (tensor.squeeze(0) * 255).clamp_(0, 255).to(torch.uint8).cpu().numpy()
     return Image.fromarray(img)
 
 
 def pil_to_tensor(pil_img: Image.Image) -> torch.Tensor:
     """Convert PIL Image to ComfyUI IMAGE tensor."""
-    if pil_img.mode != "RGBA":
+    # RGB stays 3-channel — only sources that actually carry (or need) alpha
+    # get inflated to RGBA. The float conversion copies once and the 1/255
+    # scale runs in place on that copy.
+    if pil_img.mode not in ("RGB", "RGBA"):
         pil_img = pil_img.convert("RGBA")
-    img = np.array(pil_img).astype(np.float32) / 255.0
-    return torch.from_numpy(img).unsqueeze(0)
+    arr = np.array(pil_img)
+    return torch.from_numpy(arr).to(torch.float32).mul_(1.0 / 255.0).unsqueeze_(0)
 
 
 def tensor_batch_to_pils(tensor: torch.Tensor) -> list[Image.Image]:
@@ -34,13 +38,11 @@ def tensor_batch_to_pils(tensor: torch.Tensor) -> list[Image.Image]:
 
     Accepts a single (H,W,C) tensor too (treated as a one-frame batch).
     """
-    arr = tensor.cpu().numpy()
+    # Same fused torch-side conversion as tensor_to_pil, once for the batch.
+    arr = (tensor * 255).clamp_(0, 255).to(torch.uint8).cpu().numpy()
     if arr.ndim == 3:
         arr = arr[None, ...]
-    return [
-        Image.fromarray((frame * 255).clip(0, 255).astype(np.uint8))
-        for frame in arr
-    ]
+    return [Image.fromarray(frame) for frame in arr]
 
 
 def pils_to_tensor_batch(frames: list[Image.Image]) -> torch.Tensor:
@@ -92,15 +94,22 @@ class SpriteGrid:
     def process(self, image, min_grid=4, quantize=8, remove_background="none", crop=False):
         pil_img = tensor_to_pil(image)
 
+        # Track whether any step actually altered the pixels; unchanged paths
+        # can return the caller's tensor and skip the PIL->tensor round trip.
+        unchanged = True
+
         # Remove background before detection if requested
         if remove_background == "before":
             pil_img, _ = make_background_transparent(pil_img, debug=False)
+            unchanged = False
 
         # Detect grid
         grid_w, grid_h = detect_grid(pil_img, min_grid_size=min_grid)
 
         if grid_w <= 0 or grid_h <= 0:
             # No grid detected - image is likely already clean pixel art
+            if unchanged:
+                return (image,)
             return (pil_to_tensor(pil_img),)
 
         # Calculate cells
@@ -120,15 +129,22 @@ class SpriteGrid:
                 num_cells_h,
                 bit=quantize,
             )
+            unchanged = False
 
         # Remove background after if requested
         if remove_background == "after":
             result, _ = make_background_transparent(result, debug=False)
+            unchanged = False
 
         # Crop if requested
         if crop and result.mode == "RGBA":
-            result = crop_to_content(result)
+            cropped = crop_to_content(result)
+            if cropped is not result:
+                result = cropped
+                unchanged = False
 
+        if unchanged:
+            return (image,)
         return (pil_to_tensor(result),)
 
 
@@ -8,11 +8,21 @@ Provides:
 - process_sprite(): One-shot pipeline combining all steps
 """
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, Union
 from PIL import Image
 import numpy as np
 
 
+# Lazily created U2-Net session, shared across calls so batch work loads the
+# model weights from disk only once. The lock keeps a batch's worker threads
+# from racing N concurrent model loads on first use.
+_REMBG_SESSION = None
+_REMBG_LOCK = threading.Lock()
+
+
 def remove_background(image: Image.Image) -> Image.Image:
     """
     Remove background from image using AI (rembg/U2-Net).
@@ -26,14 +36,19 @@ def remove_background(image: Image.Image) -> Image.Image:
     Raises:
         ImportError: If rembg is not installed
     """
+    global _REMBG_SESSION
     try:
-        from rembg import remove
+        from rembg import new_session, remove
     except ImportError:
         raise ImportError(
             "rembg is required for background removal. "
             "Install it with: pip install rembg onnxruntime"
         )
-    return remove(image.convert("RGBA"))
+    if _REMBG_SESSION is None:
+        with _REMBG_LOCK:
+            if _REMBG_SESSION is None:
+                _REMBG_SESSION = new_session("u2net")
+    return remove(image.convert("RGBA"), session=_REMBG_SESSION)
 
 
 def detect_bounds(image: Image.Image, alpha_threshold: int = 10) -> Optional[Tuple[int, int, int, int]]:
@@ -47,17 +62,31 @@ def detect_bounds(image: Image.Image, alpha_threshold: int = 10) -> Optional[Tup
     Returns:
         (left, top, right, bottom) or None if no content
     """
-    if image.mode != "RGBA":
-        image = image.convert("RGBA")
-
-    alpha = np.array(image)[:, :, 3]
-    coords = np.where(alpha > alpha_threshold)
-
-    if len(coords[0]) == 0:
+    if "A" not in image.getbands():
+        if "transparency" in image.info:
+            # Palette/keyed transparency still needs the real conversion.
+            image = image.convert("RGBA")
+        else:
+            # No alpha anywhere: every pixel is content (a convert to RGBA
+            # would fill alpha with 255), so skip the conversion entirely.
+            if alpha_threshold >= 255:
+                return None
+            return (0, 0, image.width, image.height)
+
+    # Reduce the alpha band to per-row/per-column "has content" vectors and
+    # find their first/last True with argmax — no per-pixel coordinate arrays.
+    alpha = np.asarray(image.getchannel("A"))
+    content = alpha > alpha_threshold
+    row_any = content.any(axis=1)
+    col_any = content.any(axis=0)
+
+    if not row_any.any():
         return None
 
-    top, bottom = int(coords[0].min()), int(coords[0].max()) + 1
-    left, right = int(coords[1].min()), int(coords[1].max()) + 1
+    top = int(row_any.argmax())
+    bottom = len(row_any) - int(row_any[::-1].argmax())
+    left = int(col_any.argmax())
+    right = len(col_any) - int(col_any[::-1].argmax())
     return (left, top, right, bottom)
 
 
@@ -301,17 +330,29 @@ def crop_and_scale_centered(
 def batch_process(
     images: list,
     size: int = 32,
+    workers: Optional[int] = None,
     **kwargs,
 ) -> list[Image.Image]:
     """
     Process multiple images.
 
+    Images are independent, so they are processed concurrently: ONNX
+    inference and the PIL/NumPy crop/scale steps all release the GIL, and
+    the threads share the cached rembg session.
+
     Args:
         images: List of PIL Images
         size: Target size for all images
+        workers: Thread count (defaults to the CPU count)
         **kwargs: Additional arguments passed to process_sprite
 
     Returns:
-        List of processed PIL Images
+        List of processed PIL Images, in input order
     """
-    return [process_sprite(img, size=size, **kwargs) for img in images]
+    if len(images) <= 1:
+        return [process_sprite(img, size=size, **kwargs) for img in images]
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        return list(
+            executor.map(lambda img: process_sprite(img, size=size, **kwargs), images)
+        )
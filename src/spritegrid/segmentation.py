@@ -1,33 +1,49 @@
 from PIL import Image
-from sklearn.cluster import DBSCAN
-from sklearn.discriminant_analysis import StandardScaler
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 
 def generate_segment_masks(
     im_arr: np.ndarray, color_weight=1.0, spatial_weight=3.0
 ) -> np.ndarray:
+    # Imported lazily so `import spritegrid` doesn't pull in sklearn (and
+    # transitively scipy) unless segmentation is actually used.
+    from sklearn.cluster import MiniBatchKMeans
+
     h, w = im_arr.shape[:2]
-    x, y = np.meshgrid(np.arange(w), np.arange(h))
 
-    # Flatten color and coordinates (use only RGB, ignore alpha if present)
+    # Build the feature matrix in one preallocated array: RGB (alpha ignored
+    # if present), followed by x, y coordinates when spatially weighted. With
+    # spatial_weight=0 the coordinate columns are omitted entirely — a hard
+    # partitioner like KMeans would otherwise still see them and carve a
+    # uniform background into spatial blocks.
     rgb_arr = im_arr[:, :, :3] if im_arr.shape[2] > 3 else im_arr
-    color_features = rgb_arr.reshape(-1, 3).astype(np.float32)
-    spatial_features = (
-        np.stack([x, y], axis=2).reshape(-1, 2).astype(np.float32)
-    )  # x, y
-
-    # Scale features independently
-    color_scaled = StandardScaler().fit_transform(color_features) * color_weight
-    spatial_scaled = StandardScaler().fit_transform(spatial_features) * spatial_weight
-
-    # Concatenate scaled features
-    dataset = np.concatenate([color_scaled, spatial_scaled], axis=1)
-
-    clusterer = DBSCAN()
-    labels = clusterer.fit_predict(dataset)
+    dataset = np.empty((h * w, 5 if spatial_weight else 3), dtype=np.float32)
+    dataset[:, :3] = rgb_arr.reshape(-1, 3)
+    blocks = [(dataset[:, :3], color_weight)]
+    if spatial_weight:
+        dataset[:, 3] = np.tile(np.arange(w, dtype=np.float32), h)  # x
+        dataset[:, 4] = np.repeat(np.arange(h, dtype=np.float32), w)  # y
+        blocks.append((dataset[:, 3:], spatial_weight))
+
+    # Standardize and weight each block in place — same (x - mean) / std
+    # mapping as StandardScaler, without its extra passes and intermediate
+    # copies. Zero-variance columns are left centred.
+    for block, weight in blocks:
+        block -= block.mean(axis=0)
+        std = block.std(axis=0)
+        std[std == 0] = 1.0
+        block /= std
+        block *= weight
+
+    # Fit on a strided subsample; a rough partition into a few clusters does
+    # not need every pixel, and predicting the full grid afterwards is cheap.
+    stride = max(1, (h * w) // 50000)
+    clusterer = MiniBatchKMeans(
+        n_clusters=3, batch_size=4096, n_init=3, random_state=0
+    )
+    clusterer.fit(dataset[::stride])
+    labels = clusterer.predict(dataset)
     label_mask = labels.reshape(h, w)
 
     if np.all(label_mask == -1):
@@ -38,24 +54,57 @@ def generate_segment_masks(
 
 
 def make_background_transparent(
-    image: Image.Image, debug=False
+    image: Image.Image | np.ndarray, debug=False
 ) -> tuple[Image.Image, Image.Image | None]:
-    im_arr = np.array(image)
-    label_mask = generate_segment_masks(im_arr)
+    # Accept a ready-made pixel array so callers that already hold one don't
+    # pay for an extra PIL->ndarray copy. (API-only convenience: in-repo
+    # callers all pass PIL images.)
+    im_arr = image if isinstance(image, np.ndarray) else np.array(image)
+
+    # Background removal only needs a rough partition, so cluster a copy
+    # downsampled to at most 256 px on the long side and expand the labels
+    # back with nearest-neighbour — clustering cost drops with the pixel
+    # count while the full-resolution mask keeps hard cell edges.
+    h, w = im_arr.shape[:2]
+    if max(h, w) > 256:
+        scale = 256 / max(h, w)
+        small = Image.fromarray(im_arr).resize(
+            (max(1, round(w * scale)), max(1, round(h * scale))),
+            Image.Resampling.BILINEAR,
+        )
+        label_small = generate_segment_masks(np.asarray(small), spatial_weight=0.0)
+        if label_small is not None:
+            label_mask = np.asarray(
+                Image.fromarray(label_small.astype(np.uint8)).resize(
+                    (w, h), Image.Resampling.NEAREST
+                )
+            ).astype(label_small.dtype)
+        else:
+            label_mask = None
+    else:
+        label_mask = generate_segment_masks(im_arr, spatial_weight=0.0)
 
     if label_mask is None:
         print("No background found.")
+        # Always hand back a PIL image, even for ndarray input — the declared
+        # return type promises one.
+        if isinstance(image, np.ndarray):
+            return Image.fromarray(im_arr), None
         return image, None
 
-    labels_flat = label_mask.flatten()
-    # For now, let's assume that the background is the most common segment
-    bg_id = np.bincount(
-        labels_flat[labels_flat != -1]
-    ).argmax()  # Find the most common label (background)
+    # The background is whichever cluster dominates the image border — the
+    # globally most common label can be the sprite itself when it covers most
+    # of the canvas. KMeans labels are small non-negative ints, so a bincount
+    # over the border ring suffices.
+    border = np.concatenate(
+        [label_mask[0], label_mask[-1], label_mask[1:-1, 0], label_mask[1:-1, -1]]
+    )
+    bg_id = np.bincount(border).argmax()
 
-    mask = (label_mask != bg_id).astype(
-        np.uint8
-    ) * 255  # Create a mask for non-background pixels
+    # Create a mask for non-background pixels; np.where emits the 0/255
+    # uint8 values directly, skipping the astype copy and the broadcast
+    # multiply of the != / astype / * 255 chain.
+    mask = np.where(label_mask != bg_id, np.uint8(255), np.uint8(0))
 
     # Make image with alpha channel
     image = Image.fromarray(im_arr)
@@ -64,31 +113,24 @@ def make_background_transparent(
 
     debug_image = None
     if debug:
-        clustered_mask = label_mask
-
-        # Generate the debug visualization as a PIL image
-        fig, ax = plt.subplots()
-        ax.imshow(image.convert("RGBA"))  # Ensure the image is displayed correctly
+        # Colorize the labels directly in NumPy rather than rasterizing a
+        # matplotlib figure: blend a random per-label palette over the input
+        # at 60% opacity, leaving -1 noise pixels unshaded.
         unique_labels = np.unique(label_mask)
-        for label in unique_labels:
-            if label == -1:  # Skip noise
-                continue
-            mask = clustered_mask == label
-            show_mask(mask, ax=ax, random_color=True)
-        plt.axis("off")
-
-        # Convert the matplotlib figure to a PIL image.
-        # fig.canvas.tostring_argb() returns ARGB bytes (4 bytes/pixel) — feeding
-        # those to Image.frombytes("RGB", ...) silently misinterpreted them as
-        # RGB (3 bytes/pixel), producing a color-shifted, bottom-truncated debug
-        # image (every visible pixel offset by one channel; the last quarter
-        # filled with garbage / black). Use buffer_rgba() so the byte format
-        # matches what PIL is told to parse.
-        fig.canvas.draw()
-        debug_image = Image.frombytes(
-            "RGBA", fig.canvas.get_width_height(), bytes(fig.canvas.buffer_rgba())
+        unique_labels = unique_labels[unique_labels != -1]
+        palette = np.random.random((len(unique_labels), 3)) * 255
+        # Lookup table indexed by label; the extra zero row at the end
+        # absorbs the -1 noise label.
+        lut = np.zeros((label_mask.max() + 2, 3))
+        lut[unique_labels] = palette
+        blend = np.where(label_mask[..., None] != -1, 0.6, 0.0)
+        shaded = (blend * lut[label_mask] + (1 - blend) * im_arr[:, :, :3]).astype(
+            np.uint8
+        )
+        debug_arr = np.dstack(
+            [shaded, np.full(label_mask.shape, 255, dtype=np.uint8)]
         )
-        plt.close(fig)  # Close the figure to free memory
+        debug_image = Image.fromarray(debug_arr, "RGBA")
 
     return image, debug_image
 
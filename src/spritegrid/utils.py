@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.spatial.distance import cdist, euclidean
 from PIL import Image
 
 
@@ -9,21 +8,25 @@ def convert_image_to_ascii(
 ) -> str:
     assert ascii_space_width is not None, "ascii_space_width must be specified"
     assert ascii_space_width > 0, "ascii_space_width must be greater than 0"
-    width, height = image.size
-    image = image.load()
-    strings = []
-    for y in range(height):
-        for x in range(width):
-            r, g, b, *a = image[x, y]
-            a = a[0] if a else 255
-            if a == 0:
-                # Transparent pixel -> uncolored space
-                strings.append(" " * ascii_space_width)
-            else:
-                # ANSI escape: background color with truecolor
-                strings.append(f"\x1b[48;2;{r};{g};{b}m" + (" " * ascii_space_width) + "\x1b[0m")
-        strings.append("\n")
-    return "".join(strings)
+    arr = np.asarray(image.convert("RGBA"))
+    height, width = arr.shape[:2]
+    space = " " * ascii_space_width
+
+    # Pixel art has few distinct colors, so format each unique color once and
+    # gather the per-pixel strings through a lookup table instead of running
+    # the f-string machinery per pixel.
+    colors, inverse = np.unique(arr.reshape(-1, 4), axis=0, return_inverse=True)
+    lut = np.array(
+        [
+            # Transparent pixel -> uncolored space; otherwise ANSI escape:
+            # background color with truecolor
+            space if a == 0 else f"\x1b[48;2;{r};{g};{b}m{space}\x1b[0m"
+            for r, g, b, a in colors
+        ],
+        dtype=object,
+    )
+    cells = lut[inverse].reshape(height, width)
+    return "".join("".join(row) + "\n" for row in cells)
 
 
 def naive_median(X: np.ndarray) -> np.ndarray:
@@ -47,34 +50,72 @@ def geometric_median(X: np.ndarray, eps: float = 1e-5) -> np.ndarray:
     https://stackoverflow.com/questions/30299267/geometric-median-of-multidimensional-points
 
     """
+    X = np.asarray(X, dtype=np.float64)
     y = np.mean(X, 0)
 
+    # Distances to the single current estimate are computed with fused
+    # in-place ufuncs on a reused buffer; a cdist call here is all dispatch
+    # overhead for a one-row right-hand side.
+    diff = np.empty_like(X)
+    eps2 = eps * eps  # compare squared movement; skips a sqrt per iteration
+
     while True:
-        D = cdist(X, [y])
-        nonzeros = (D != 0)[:, 0]
-
-        Dinv = 1 / D[nonzeros]
-        Dinvs = np.sum(Dinv)
-        W = Dinv / Dinvs
-        T = np.sum(W * X[nonzeros], 0)
-
-        num_zeros = len(X) - np.sum(nonzeros)
-        if num_zeros == 0:
-            y1 = T
-        elif num_zeros == len(X):
-            return y
-        else:
-            R = (T - y) * Dinvs
-            r = np.linalg.norm(R)
-            rinv = 0 if r == 0 else num_zeros / r
-            y1 = max(0, 1 - rinv) * T + min(1, rinv) * y
-
-        if euclidean(y, y1) < eps:
+        np.subtract(X, y, out=diff)
+        np.square(diff, out=diff)
+        D = diff.sum(axis=1)
+        np.sqrt(D, out=D)
+
+        # Floor the distances instead of masking out zero rows — the fancy
+        # index copied X every iteration, and a floored coincident point just
+        # dominates the weights, which drives the estimate to it anyway.
+        # Same guard the batched solver uses.
+        np.maximum(D, 1e-8, out=D)
+        Dinv = 1 / D
+        W = Dinv / Dinv.sum()
+        y1 = np.sum(W[:, None] * X, 0)
+
+        if ((y1 - y) ** 2).sum() < eps2:
             return y1
 
         y = y1
 
 
+def geometric_median_batch(
+    pixels: np.ndarray, eps: float = 1e-5, max_iterations: int = 128
+) -> np.ndarray:
+    """
+    Weiszfeld geometric median of many point sets at once.
+
+    Runs Weiszfeld steps as broadcast ndarray operations over the leading
+    axis until every set has moved less than *eps*, so N independent medians
+    cost a handful of large C-level kernels per step instead of one
+    Python-level iteration per set. Internally the points are transposed to
+    a structure-of-arrays (C, N, K) layout so each per-channel accumulation
+    runs unit-stride over the contiguous K axis.
+
+    Args:
+        pixels: (N, K, C) array — N independent sets of K points.
+        eps: Convergence threshold on the per-step movement.
+        max_iterations: Safety cap on the number of Weiszfeld steps.
+
+    Returns:
+        (N, C) array of geometric medians.
+    """
+    pts = np.ascontiguousarray(
+        np.moveaxis(pixels, -1, 0), dtype=np.float64
+    )  # (C, N, K)
+    y = pts.mean(axis=2)  # (C, N)
+    for _ in range(max_iterations):
+        sq_distances = ((pts - y[:, :, None]) ** 2).sum(axis=0)  # (N, K)
+        weights = 1.0 / np.maximum(np.sqrt(sq_distances), 1e-8)
+        y_next = (pts * weights).sum(axis=2) / weights.sum(axis=1)
+        moved = np.abs(y_next - y).max()
+        y = y_next
+        if moved < eps:
+            break
+    return y.T
+
+
 def crop_to_content(image: Image.Image) -> Image.Image:
     """
     Automatically crop an image with an alpha channel to the first and last rows and columns
@@ -90,26 +131,15 @@ def crop_to_content(image: Image.Image) -> Image.Image:
     if image.mode != "RGBA":
         return image
 
-    # Get alpha channel
-    alpha = np.array(image.split()[3])
-
-    # Find the bounding box of non-transparent pixels
-    # Get the non-zero alpha locations
-    non_transparent = np.where(alpha > 0)
+    # Pillow's getbbox scans the alpha band for non-zero pixels in C and
+    # returns the tight (left, upper, right, lower) box directly — no NumPy
+    # arrays or index math needed.
+    bbox = image.getchannel("A").getbbox()
 
-    if len(non_transparent[0]) == 0:  # No non-transparent pixels found
+    if bbox is None:  # No non-transparent pixels found
         return image
 
-    # Find the bounding box
-    min_y, max_y = non_transparent[0].min(), non_transparent[0].max()
-    min_x, max_x = non_transparent[1].min(), non_transparent[1].max()
-
-    # Add 1 to max values because PIL's crop is inclusive of the start coordinates
-    # but exclusive of the end coordinates
-    # Crop the image to the bounding box
-    cropped_image = image.crop((min_x, min_y, max_x + 1, max_y + 1))
-
-    return cropped_image
+    return image.crop(bbox)
 
 
 def enforce_symmetry(image: Image.Image) -> Image.Image:
@@ -135,45 +165,32 @@ def enforce_symmetry(image: Image.Image) -> Image.Image:
     arr = np.array(image)
     h, w = arr.shape[:2]
     has_alpha = arr.shape[2] == 4
+    half = w // 2
+
+    # Calculate confidence for every pixel at once
+    # Confidence = how "decisive" the color is (distance from gray/ambiguous):
+    # saturation plus distance of the brightness from middle gray (128).
+    rgb = arr[..., :3].astype(np.int16)
+    saturation = rgb.max(axis=-1) - rgb.min(axis=-1)
+    gray_distance = np.abs(rgb.sum(axis=-1) / 3 - 128)
+    confidence = saturation + gray_distance
+    if has_alpha:
+        # Transparent pixels have no confidence
+        confidence[arr[..., 3] < 128] = 0
+
+    # Each mirror pair is independent: compare the left half against the
+    # horizontally flipped array and let the higher-confidence pixel win
+    # both positions (ties keep the left pixel, as before).
+    flipped = arr[:, ::-1]
+    left = arr[:, :half]
+    right = flipped[:, :half]  # mirror partner of each left pixel
+    differ = np.any(left != right, axis=-1)
+    left_wins = confidence[:, :half] >= confidence[:, ::-1][:, :half]
 
-    # Calculate confidence for each pixel
-    # Confidence = how "decisive" the color is (distance from gray/ambiguous)
-    def pixel_confidence(pixel):
-        if has_alpha and pixel[3] < 128:
-            return 0  # Transparent pixels have no confidence
-
-        r, g, b = pixel[0], pixel[1], pixel[2]
-
-        # Confidence based on saturation and distance from middle gray
-        max_c, min_c = max(r, g, b), min(r, g, b)
-        saturation = (max_c - min_c) if max_c > 0 else 0
-
-        # Distance from middle gray (128, 128, 128)
-        brightness = (int(r) + int(g) + int(b)) / 3
-        gray_distance = abs(brightness - 128)
-
-        # Combined confidence: high saturation OR very dark/bright
-        return saturation + gray_distance
-
-    # Process each mirror pair
     result = arr.copy()
-
-    for y in range(h):
-        for x in range(w // 2):
-            mx = w - 1 - x  # Mirror x position
-
-            p1 = arr[y, x]
-            p2 = arr[y, mx]
-
-            # Check if pixels are different
-            if not np.array_equal(p1, p2):
-                c1 = pixel_confidence(p1)
-                c2 = pixel_confidence(p2)
-
-                # Use the pixel with higher confidence for both positions
-                if c1 >= c2:
-                    result[y, mx] = p1
-                else:
-                    result[y, x] = p2
+    take_right = differ & ~left_wins
+    result[:, :half][take_right] = right[take_right]
+    take_left = differ & left_wins
+    result[:, ::-1][:, :half][take_left] = left[take_left]
 
     return Image.fromarray(result)
@@ -6,17 +6,12 @@ like test_comfyui_nodes.py.
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
 import numpy as np
 import pytest
 from PIL import Image
 
 torch = pytest.importorskip("torch")
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
-
 from spritegrid.comfyui.nodes import (  # noqa: E402
     NODE_CLASS_MAPPINGS,
     NODE_DISPLAY_NAME_MAPPINGS,
@@ -2,17 +2,12 @@
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
 import numpy as np
 import pytest
 from PIL import Image
 
 torch = pytest.importorskip("torch")
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
-
 from spritegrid.comfyui.nodes import (
     NODE_CLASS_MAPPINGS,
     NODE_DISPLAY_NAME_MAPPINGS,
@@ -106,15 +101,21 @@ class TestPilToTensor:
         t = pil_to_tensor(img)
         assert t.dtype == torch.float32
 
-    def test_output_shape_is_1_h_w_4(self):
+    def test_output_shape_is_1_h_w_c(self):
         img = Image.new("RGB", (6, 10), (0, 0, 0))
         t = pil_to_tensor(img)
-        assert t.shape == (1, 10, 6, 4)
+        assert t.shape == (1, 10, 6, 3)
 
-    def test_rgb_image_converted_to_rgba(self):
+    def test_rgb_image_stays_three_channel(self):
         img = Image.new("RGB", (4, 4), (255, 0, 0))
         t = pil_to_tensor(img)
-        # RGBA → 4 channels
+        # RGB passes through without alpha inflation
+        assert t.shape[-1] == 3
+
+    def test_palette_image_converted_to_rgba(self):
+        img = Image.new("P", (4, 4))
+        t = pil_to_tensor(img)
+        # Modes other than RGB/RGBA are normalised to RGBA
         assert t.shape[-1] == 4
 
     def test_values_in_zero_one_range(self):
@@ -144,7 +145,7 @@ class TestPilToTensor:
     def test_size_h_w_order(self):
         img = Image.new("RGB", (12, 8))  # width=12, height=8
         t = pil_to_tensor(img)
-        assert t.shape == (1, 8, 12, 4)
+        assert t.shape == (1, 8, 12, 3)
 
 
 # ---------------------------------------------------------------------------
@@ -7,6 +7,7 @@ import pytest
 from PIL import Image
 
 from spritegrid.detection import (
+    _dominant_spacing_fft,
     find_dominant_spacing,
     detect_grid,
     detect_grid_with_offset,
@@ -58,15 +59,13 @@ class TestFindDominantSpacing:
     def test_regular_peaks_detected(self):
         """A profile with peaks every 8 units should return spacing~8."""
         profile = np.zeros(100)
-        for i in range(0, 100, 8):
-            profile[i] = 100.0
+        profile[::8] = 100.0
         spacing, conf = find_dominant_spacing(profile, min_spacing=4)
         assert spacing > 0  # some spacing detected
 
     def test_confidence_between_zero_and_one(self):
         profile = np.zeros(80)
-        for i in range(0, 80, 8):
-            profile[i] = 100.0
+        profile[::8] = 100.0
         spacing, conf = find_dominant_spacing(profile, min_spacing=4)
         assert 0.0 <= conf <= 1.0
 
@@ -79,13 +78,58 @@ class TestFindDominantSpacing:
 
     def test_returns_int_spacing(self):
         profile = np.zeros(80)
-        for i in range(0, 80, 10):
-            profile[i] = 100.0
+        profile[::10] = 100.0
         spacing, conf = find_dominant_spacing(profile, min_spacing=5)
         if spacing != 0:
             assert isinstance(spacing, int)
 
 
+# ---------------------------------------------------------------------------
+# _dominant_spacing_fft — the short-circuit for profiles longer than 2048
+# ---------------------------------------------------------------------------
+
+def _comb_profile(n: int, spacing: int, peak: float = 100.0) -> np.ndarray:
+    """Gradient-profile stand-in: flat baseline with a peak at every grid line."""
+    profile = np.full(n, 10.0)
+    profile[::spacing] += peak
+    return profile
+
+
+class TestDominantSpacingFft:
+    def test_long_profile_known_spacing(self):
+        """A >2048-sample comb with spacing 8 is resolved by the FFT path."""
+        profile = _comb_profile(3000, 8)
+        spacing, conf = _dominant_spacing_fft(profile, 3)
+        assert spacing == 8
+        assert conf >= 0.5
+        # ...and find_dominant_spacing agrees end to end.
+        assert find_dominant_spacing(profile, min_spacing=3)[0] == 8
+
+    def test_vignette_period_not_returned(self):
+        """A low-frequency component must not masquerade as the grid spacing.
+
+        A comb at a multiple of the true spacing still lands on grid lines,
+        so without the harmonic-artefact guards the FFT path confidently
+        returned the vignette period (150) instead of the real spacing (5).
+        """
+        profile = _comb_profile(3000, 5)
+        profile += 60.0 * (1 + np.sin(2 * np.pi * np.arange(3000) / 150))
+        spacing, _conf = _dominant_spacing_fft(profile, 3)
+        assert spacing in (0, 5)  # either resolved or handed to the peak path
+        assert find_dominant_spacing(profile, min_spacing=3)[0] == 5
+
+    def test_no_grid_long_profile_falls_through(self):
+        """With no grid comb the FFT path must decline, not invent a spacing.
+
+        Declining means returning spacing 0 outright or a confidence below
+        the 0.5 gate in find_dominant_spacing — either way the exact peak
+        path takes over.
+        """
+        profile = 60.0 * (1 + np.sin(2 * np.pi * np.arange(3000) / 150))
+        spacing, conf = _dominant_spacing_fft(profile, 3)
+        assert spacing == 0 or conf < 0.5
+
+
 # ---------------------------------------------------------------------------
 # detect_grid
 # ---------------------------------------------------------------------------
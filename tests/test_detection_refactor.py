@@ -9,6 +9,7 @@ decomposition is exact.
 from __future__ import annotations
 
 import numpy as np
+import pytest
 from PIL import Image
 
 from spritegrid.detection import (
@@ -31,27 +32,40 @@ def _make_grid_image(cell_size: int, cells_w: int, cells_h: int,
     return Image.fromarray(arr)
 
 
+@pytest.fixture(scope="module")
+def grid_cache():
+    """Per-module cache of synthesized grid images, keyed by geometry.
+
+    Several tests exercise detect_grid() on the same patterns; building each
+    image once amortizes the synthesis cost across the parametrized cases.
+    """
+    return {}
+
+
+def _get_grid(cache, *args):
+    return cache.setdefault(args, _make_grid_image(*args))
+
+
 class TestComputeGradientProfiles:
-    def test_profile_lengths_match_dimensions(self):
-        img = _make_grid_image(8, 10, 6)  # 80 x 48
+    def test_profile_lengths_match_dimensions(self, grid_cache):
+        img = _get_grid(grid_cache, 8, 10, 6)  # 80 x 48
         profile_h, profile_v = compute_gradient_profiles(img)
         assert len(profile_h) == img.width
         assert len(profile_v) == img.height
 
-    def test_handles_rgba_and_l_modes(self):
-        rgba = _make_grid_image(8, 6, 6).convert("RGBA")
-        gray = _make_grid_image(8, 6, 6).convert("L")
-        for img in (rgba, gray):
+    def test_handles_rgba_and_l_modes(self, grid_cache):
+        base = _get_grid(grid_cache, 8, 6, 6)  # synthesize once, convert per mode
+        for img in (base.convert("RGBA"), base.convert("L")):
             ph, pv = compute_gradient_profiles(img)
             assert len(ph) == img.width and len(pv) == img.height
 
 
 class TestDecompositionIsExact:
-    def test_from_profiles_equals_with_offset(self):
-        for cell in (4, 6, 8, 10):
-            img = _make_grid_image(cell, 9, 9)
-            ph, pv = compute_gradient_profiles(img)
-            assert detect_grid_from_profiles(ph, pv) == detect_grid_with_offset(img)
+    @pytest.mark.parametrize("cell", [4, 6, 8, 10])
+    def test_from_profiles_equals_with_offset(self, grid_cache, cell):
+        img = _get_grid(grid_cache, cell, 9, 9)
+        ph, pv = compute_gradient_profiles(img)
+        assert detect_grid_from_profiles(ph, pv) == detect_grid_with_offset(img)
 
     def test_too_small_profiles_return_zeros(self):
         assert detect_grid_from_profiles(np.zeros(5), np.zeros(5), min_grid_size=4) == (
@@ -60,12 +74,12 @@ class TestDecompositionIsExact:
 
 
 class TestBackwardCompatibility:
-    def test_known_grid_recovered(self):
-        img = _make_grid_image(8, 10, 10)
+    def test_known_grid_recovered(self, grid_cache):
+        img = _get_grid(grid_cache, 8, 10, 10)
         assert detect_grid_with_offset(img)[:2] == (8, 8)
 
-    def test_detect_grid_wrapper_matches(self):
-        img = _make_grid_image(8, 10, 10)
+    def test_detect_grid_wrapper_matches(self, grid_cache):
+        img = _get_grid(grid_cache, 8, 10, 10)
         gw, gh, _ox, _oy = detect_grid_with_offset(img)
         assert detect_grid(img) == (gw, gh)
 
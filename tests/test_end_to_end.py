@@ -9,12 +9,18 @@ def test_spritegrid_cli(tmp_path):
     # Setup paths
     input_image = Path("tests/data/input/centurion.png")
     output_file = tmp_path / "output.png"
+
+    # Keep the persistent detection cache out of the test: a pre-existing
+    # entry would mask detection regressions, and the run must not write
+    # into the user's real cache directory.
+    env = {**os.environ, "XDG_CACHE_HOME": str(tmp_path)}
     
     # Run CLI command with proper arguments
     result = subprocess.run(
         [sys.executable, "-m", "spritegrid.cli", str(input_image), "-o", str(output_file)],
         capture_output=True,
-        text=True
+        text=True,
+        env=env,
     )
     
     # Verify CLI execution
@@ -50,12 +56,18 @@ def test_spritegrid_cli_with_background_removal(tmp_path):
     # Setup paths
     input_image = Path("assets/examples/centurion.png")
     output_file = tmp_path / "output.png"
+
+    # Keep the persistent detection cache out of the test: a pre-existing
+    # entry would mask detection regressions, and the run must not write
+    # into the user's real cache directory.
+    env = {**os.environ, "XDG_CACHE_HOME": str(tmp_path)}
     
     # Run CLI command with background removal
     result = subprocess.run(
         [sys.executable, "-m", "spritegrid.cli", str(input_image), "-o", str(output_file), "-b"],
         capture_output=True,
-        text=True
+        text=True,
+        env=env,
     )
     
     # Verify CLI execution
@@ -90,12 +102,18 @@ def test_spritegrid_cli_with_cropping(tmp_path):
     # Setup paths
     input_image = Path("tests/data/input/centurion.png")
     output_file = tmp_path / "output.png"
+
+    # Keep the persistent detection cache out of the test: a pre-existing
+    # entry would mask detection regressions, and the run must not write
+    # into the user's real cache directory.
+    env = {**os.environ, "XDG_CACHE_HOME": str(tmp_path)}
     
     # Run CLI command with cropping
     result = subprocess.run(
         [sys.executable, "-m", "spritegrid.cli", str(input_image), "-o", str(output_file), "-c"],
         capture_output=True,
-        text=True
+        text=True,
+        env=env,
     )
     
     # Verify CLI execution
@@ -133,12 +151,18 @@ def test_spritegrid_cli_with_ascii_output(tmp_path):
     # Setup paths
     input_image = Path("tests/data/input/centurion.png")
     output_file = tmp_path / "output.txt"
+
+    # Keep the persistent detection cache out of the test: a pre-existing
+    # entry would mask detection regressions, and the run must not write
+    # into the user's real cache directory.
+    env = {**os.environ, "XDG_CACHE_HOME": str(tmp_path)}
     
     # Run CLI command with ASCII output
     result = subprocess.run(
         [sys.executable, "-m", "spritegrid.cli", str(input_image), "-o", str(output_file), "-a", "1"],
         capture_output=True,
-        text=True
+        text=True,
+        env=env,
     )
     
     # Verify CLI execution
@@ -174,11 +198,17 @@ def test_spritegrid_idempotence(tmp_path):
     first_output = tmp_path / "first_output.png"
     second_output = tmp_path / "second_output.png"
 
+    # Keep the persistent detection cache out of the test: a pre-existing
+    # entry would mask detection regressions, and the run must not write
+    # into the user's real cache directory.
+    env = {**os.environ, "XDG_CACHE_HOME": str(tmp_path)}
+
     # First pass: process the original image
     result1 = subprocess.run(
         [sys.executable, "-m", "spritegrid.cli", str(input_image), "-o", str(first_output)],
         capture_output=True,
-        text=True
+        text=True,
+        env=env,
     )
     assert result1.returncode == 0, f"First pass failed: {result1.stderr}"
     assert first_output.exists(), "First output was not created"
@@ -187,7 +217,8 @@ def test_spritegrid_idempotence(tmp_path):
     result2 = subprocess.run(
         [sys.executable, "-m", "spritegrid.cli", str(first_output), "-o", str(second_output)],
         capture_output=True,
-        text=True
+        text=True,
+        env=env,
     )
     assert result2.returncode == 0, f"Second pass failed: {result2.stderr}"
     assert second_output.exists(), "Second output was not created"
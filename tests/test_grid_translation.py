@@ -180,6 +180,7 @@ class TestCreateDownsampledImageOffset:
 
 class TestCliOffsetArgs:
     def test_offset_parsed(self, tmp_path):
+        import os
         import subprocess
         import sys
         img = _solid = _make_grid_image(4, 8, 8)
@@ -190,11 +191,13 @@ class TestCliOffsetArgs:
             [sys.executable, "-m", "spritegrid", str(src), "-o", str(out),
              "--offset", "2x2"],
             capture_output=True, text=True,
+            env={**os.environ, "XDG_CACHE_HOME": str(tmp_path)},
         )
         # Should not error on argument parsing
         assert result.returncode == 0 or "error" not in result.stderr.lower().split("offset")[0]
 
     def test_auto_offset_flag(self, tmp_path):
+        import os
         import subprocess
         import sys
         img = _make_grid_image(4, 8, 8)
@@ -205,5 +208,6 @@ class TestCliOffsetArgs:
             [sys.executable, "-m", "spritegrid", str(src), "-o", str(out),
              "--auto-offset"],
             capture_output=True, text=True,
+            env={**os.environ, "XDG_CACHE_HOME": str(tmp_path)},
         )
         assert result.returncode == 0 or "error" not in result.stderr.lower()
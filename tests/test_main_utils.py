@@ -32,13 +32,15 @@ class TestLoadImage:
         from spritegrid.main import load_image
         mock_response = MagicMock()
         mock_response.headers = {"content-type": "image/png"}
-        # Create a fake PNG in memory
+        # Create a fake PNG in memory, exposed via the streamed raw interface
         buf = BytesIO()
         Image.new("RGB", (2, 2), (0, 255, 0)).save(buf, format="PNG")
-        mock_response.content = buf.getvalue()
+        mock_response.raw = MagicMock()
+        mock_response.raw.read = BytesIO(buf.getvalue()).read
         mock_response.raise_for_status = MagicMock()
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("spritegrid.main._get_session") as get_session:
+            get_session.return_value.get.return_value = mock_response
             result = load_image("http://example.com/img.png")
         assert isinstance(result, Image.Image)
 
@@ -48,7 +50,8 @@ class TestLoadImage:
         mock_response.headers = {"content-type": "text/html"}
         mock_response.raise_for_status = MagicMock()
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("spritegrid.main._get_session") as get_session:
+            get_session.return_value.get.return_value = mock_response
             result = load_image("http://example.com/page.html")
         assert result is None
 